@@ -226,6 +226,57 @@ router.post('/', validate(createContactSchema), async (req, res) => {
   res.status(201).json({ data: contact })
 })
 
+// POST /api/contacts/batch
+// Creates each contact independently. Results are aligned with the request
+// array (null where creation failed); responds 207 if any item failed.
+router.post('/batch', async (req, res) => {
+  if (!Array.isArray(req.body)) {
+    res.status(400).json({
+      error: { code: 'NO_DATA', message: 'JSON array of contacts required' },
+    })
+    return
+  }
+
+  const contacts: any[] = []
+  const errors: Array<{ index: number; code: string; message: string }> = []
+
+  for (let i = 0; i < req.body.length; i++) {
+    const parsed = createContactSchema.safeParse(req.body[i])
+    if (!parsed.success) {
+      contacts.push(null)
+      errors.push({
+        index: i,
+        code: 'VALIDATION_ERROR',
+        message: parsed.error.issues.map((issue) => issue.message).join('; '),
+      })
+      continue
+    }
+
+    const body = parsed.data
+    try {
+      const contact = await prisma.contact.create({
+        data: {
+          ...body,
+          email: body.email || null,
+          photoUrl: body.photoUrl || null,
+          linkedinUrl: body.linkedinUrl || null,
+          twitterUrl: body.twitterUrl || null,
+          website: body.website || null,
+          contactDueAt: calculateContactDueAt(body.cadence, null),
+        },
+      })
+      contacts.push(contact)
+    } catch (err: any) {
+      contacts.push(null)
+      errors.push({ index: i, code: 'CREATE_FAILED', message: err.message })
+    }
+  }
+
+  res.status(errors.length ? 207 : 201).json({
+    data: { contacts, errors },
+  })
+})
+
 // PUT /api/contacts/:id
 router.put('/:id', validate(updateContactSchema), async (req, res) => {
   const id = parseInt(req.params.id as string, 10)
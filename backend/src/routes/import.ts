@@ -7,6 +7,7 @@ import { tmpdir } from 'os'
 import { join } from 'path'
 import { mkdtempSync, rmSync, readdirSync, existsSync, readFileSync } from 'fs'
 import prisma from '../config/database.js'
+import { recalculateContactDates } from './interactions.js'
 
 const router = Router()
 const upload = multer({ storage: multer.memoryStorage(), limits: { fileSize: 150 * 1024 * 1024 } }) // 150MB for .abbu files
@@ -120,18 +121,35 @@ router.post('/interactions', upload.single('file'), async (req, res) => {
   ]
 
   let imported = 0
+  const knownContactIds = new Map<number, boolean>()
+  const touchedContactIds = new Set<number>()
   for (let i = 0; i < rows.length; i++) {
     const row = rows[i]
+    const rawContactId = row.contact_id ?? row.contactId
     const email = row.email || row.contact_email
-
-    if (!email) {
-      errors.push({ row: i + 1, field: 'email', message: 'Contact email is required for matching' })
-      continue
-    }
-
-    const contact = await prisma.contact.findFirst({ where: { email } })
-    if (!contact) {
-      errors.push({ row: i + 1, field: 'email', message: `No contact found with email: ${email}` })
+    let contactId: number
+
+    if (rawContactId != null) {
+      // Match directly by contact ID (used by the iOS sync script)
+      contactId = parseInt(rawContactId, 10)
+      if (!knownContactIds.has(contactId)) {
+        const exists = Number.isInteger(contactId)
+          && (await prisma.contact.count({ where: { id: contactId } })) > 0
+        knownContactIds.set(contactId, exists)
+      }
+      if (!knownContactIds.get(contactId)) {
+        errors.push({ row: i + 1, field: 'contact_id', message: `No contact found with id: ${rawContactId}` })
+        continue
+      }
+    } else if (email) {
+      const contact = await prisma.contact.findFirst({ where: { email } })
+      if (!contact) {
+        errors.push({ row: i + 1, field: 'email', message: `No contact found with email: ${email}` })
+        continue
+      }
+      contactId = contact.id
+    } else {
+      errors.push({ row: i + 1, field: 'email', message: 'Contact email or contact_id is required for matching' })
       continue
     }
 
@@ -147,23 +165,31 @@ router.post('/interactions', upload.single('file'), async (req, res) => {
       continue
     }
 
+    const durationSeconds = row.duration_seconds || row.durationSeconds
+
     try {
       await prisma.interaction.create({
         data: {
-          contactId: contact.id,
+          contactId,
           type: type as any,
           content: row.content || null,
-          durationSeconds: row.duration_seconds ? parseInt(row.duration_seconds, 10) : null,
+          durationSeconds: durationSeconds ? parseInt(durationSeconds, 10) : null,
           occurredAt: new Date(occurredAt),
           source: (row.source || 'MANUAL').toUpperCase() as any,
         },
       })
       imported++
+      touchedContactIds.add(contactId)
     } catch (err: any) {
       errors.push({ row: i + 1, field: 'unknown', message: err.message })
     }
   }
 
+  // Recalculate lastContactedAt and contactDueAt once per affected contact
+  for (const contactId of touchedContactIds) {
+    await recalculateContactDates(contactId)
+  }
+
   res.json({
     data: { imported, skipped: errors.length, errors },
   })
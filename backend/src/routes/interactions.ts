@@ -129,7 +129,7 @@ router.delete('/interactions/:id', async (req, res) => {
   res.json({ data: { deleted: true } })
 })
 
-async function recalculateContactDates(contactId: number) {
+export async function recalculateContactDates(contactId: number) {
   // Find most recent interaction (ANY type for cadence)
   const mostRecent = await prisma.interaction.findFirst({
     where: { contactId },
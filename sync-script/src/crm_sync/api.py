@@ -1,14 +1,19 @@
 """CRM API client for Citadel CRM."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Iterator
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Contact data for API operations."""
 
@@ -21,13 +26,13 @@ class Contact:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """Interaction data for API operations."""
 
     contact_id: int
     type: str  # CALL_INBOUND, CALL_OUTBOUND, CALL_MISSED, TEXT_INBOUND, TEXT_OUTBOUND
-    occurred_at: str  # ISO 8601 datetime
+    occurred_at: str | datetime  # ISO 8601 string or aware datetime (orjson formats it)
     content: str | None = None
     duration_seconds: int | None = None
     source: str = "IMPORT_IOS"
@@ -36,29 +41,51 @@ class Interaction:
 class CRMClient:
     """Client for Citadel CRM REST API."""
 
-    def __init__(self, base_url: str, api_key: str = ""):
+    def __init__(self, base_url: str, api_key: str = "", max_workers: int = 8):
         """Initialize the CRM client.
 
         Args:
             base_url: Base URL of the CRM API (e.g., "http://localhost:3001")
             api_key: Optional API key for authentication
+            max_workers: Default number of concurrent requests for paginated
+                fetches and batch uploads
         """
         self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
         self.session = self._create_session(api_key)
+        # Bulk endpoints insert row by row without rolling back, so a retried
+        # POST after a 5xx or read timeout could duplicate the whole chunk.
+        # They fail as a unit instead and are re-sent on the next run.
+        self.bulk_session = self._create_session(api_key, retry_posts=False)
 
-    def _create_session(self, api_key: str) -> requests.Session:
-        """Create a requests session with retry logic."""
+    def _create_session(self, api_key: str, retry_posts: bool = True) -> requests.Session:
+        """Create a requests session with retry logic.
+
+        Args:
+            api_key: Optional API key for authentication
+            retry_posts: Whether POST requests are retried too
+        """
         session = requests.Session()
 
         # Configure retries for transient failures
+        allowed_methods = ["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
+        if retry_posts:
+            allowed_methods.append("POST")
         retry = Retry(
             total=3,
             backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
+            allowed_methods=allowed_methods,
             respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # All requests go to a single host, so keep one pool of persistent
+        # sockets sized for concurrent batch workers
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(32, self.max_workers),
+            pool_block=False,
+            max_retries=retry,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -89,44 +116,54 @@ class CRMClient:
             timeout=(5, 30),
         )
         response.raise_for_status()
-        data = response.json()
-
-        contacts = [
-            Contact(
-                id=c["id"],
-                first_name=c["firstName"],
-                last_name=c["lastName"],
-                phone=c.get("phone"),
-                email=c.get("email"),
-                organization=c.get("organization"),
-                notes=c.get("notes"),
-            )
-            for c in data["data"]
-        ]
+        data = orjson.loads(response.content)
+
+        contacts = [_contact_from_api(c) for c in data["data"]]
 
         total = data["meta"]["total"]
         return contacts, total
 
-    def get_all_contacts(self) -> list[Contact]:
-        """Fetch all contacts from CRM (handles pagination).
+    def iter_all_contacts(self, workers: int | None = None) -> Iterator[Contact]:
+        """Iterate over all contacts in CRM (handles pagination).
 
-        Returns:
-            List of all contacts
+        The first page is fetched to learn the total, then the remaining
+        pages are fetched concurrently. Contacts are yielded page by page.
+
+        Args:
+            workers: Maximum number of concurrent page requests
+                (defaults to ``max_workers``)
+
+        Yields:
+            Contact for each contact in CRM
         """
-        all_contacts = []
-        page = 1
         limit = 100
 
-        while True:
-            contacts, total = self.get_contacts(page=page, limit=limit)
-            all_contacts.extend(contacts)
+        contacts, total = self.get_contacts(page=1, limit=limit)
+        yield from contacts
+
+        pages = math.ceil(total / limit)
+        if pages <= 1:
+            return
 
-            if len(all_contacts) >= total:
-                break
+        with ThreadPoolExecutor(max_workers=workers or self.max_workers) as executor:
+            # map() keeps pages in order so results match a serial fetch
+            for contacts, _ in executor.map(
+                lambda page: self.get_contacts(page=page, limit=limit),
+                range(2, pages + 1),
+            ):
+                yield from contacts
 
-            page += 1
+    def get_all_contacts(self, workers: int | None = None) -> list[Contact]:
+        """Fetch all contacts from CRM (handles pagination).
 
-        return all_contacts
+        Args:
+            workers: Maximum number of concurrent page requests
+                (defaults to ``max_workers``)
+
+        Returns:
+            List of all contacts
+        """
+        return list(self.iter_all_contacts(workers=workers))
 
     def create_contact(self, contact: Contact) -> Contact:
         """Create a single contact in CRM.
@@ -137,43 +174,86 @@ class CRMClient:
         Returns:
             Created contact with ID
         """
-        payload = {
-            "firstName": contact.first_name,
-            "lastName": contact.last_name,
-        }
-
-        if contact.phone:
-            payload["phone"] = contact.phone
-        if contact.email:
-            payload["email"] = contact.email
-        if contact.organization:
-            payload["organization"] = contact.organization
-        if contact.notes:
-            payload["notes"] = contact.notes
-
         response = self.session.post(
             f"{self.base_url}/api/contacts",
-            json=payload,
+            data=orjson.dumps(_contact_payload(contact)),
             timeout=(5, 30),
         )
         response.raise_for_status()
-        data = response.json()["data"]
-
-        return Contact(
-            id=data["id"],
-            first_name=data["firstName"],
-            last_name=data["lastName"],
-            phone=data.get("phone"),
-            email=data.get("email"),
-            organization=data.get("organization"),
-            notes=data.get("notes"),
-        )
+        return _contact_from_api(orjson.loads(response.content)["data"])
+
+    def create_contacts_batch(
+        self,
+        contacts: list[Contact],
+        chunk_size: int = 500,
+        workers: int | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> list[Contact | None]:
+        """Create multiple contacts in batches.
+
+        Each chunk is posted to the batch endpoint in a single request, with
+        up to ``workers`` chunks in flight at once.
+
+        Args:
+            contacts: List of contacts to create
+            chunk_size: Number of contacts per request
+            workers: Maximum number of concurrent batch requests
+                (defaults to ``max_workers``)
+            on_progress: Called with the number of contacts in each chunk
+                as its results arrive (optional)
+
+        Returns:
+            Created contact with ID for each input contact, in order,
+            or None where creation failed
+        """
+        it = iter(contacts)
+        results: list[Contact | None] = []
+
+        with ThreadPoolExecutor(max_workers=workers or self.max_workers) as executor:
+            for created in executor.map(
+                self._create_contacts_chunk,
+                iter(lambda: list(islice(it, chunk_size)), []),
+            ):
+                results.extend(created)
+                if on_progress:
+                    on_progress(len(created))
 
-    def bulk_import_contacts(self, contacts: list[dict[str, Any]]) -> dict[str, Any]:
+        return results
+
+    def _create_contacts_chunk(self, contacts: list[Contact]) -> list[Contact | None]:
+        """Post one chunk of contacts to the batch endpoint.
+
+        Args:
+            contacts: Contacts to create
+
+        Returns:
+            Created contact for each input contact, or None where creation failed
+        """
+        try:
+            response = self.bulk_session.post(
+                f"{self.base_url}/api/contacts/batch",
+                data=orjson.dumps([_contact_payload(c) for c in contacts]),
+                timeout=(5, 120),  # Longer timeout for bulk operations
+            )
+            # 207 (partial success) still carries per-item results
+            response.raise_for_status()
+            created = orjson.loads(response.content)["data"]["contacts"]
+            return [_contact_from_api(c) if c else None for c in created]
+        except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+            # Failed request or unexpected body (e.g. a proxy error page)
+            return [None] * len(contacts)
+
+    def bulk_import_contacts(
+        self, contacts: list[dict[str, Any]], chunk_size: int = 500
+    ) -> dict[str, Any]:
         """Bulk import contacts to CRM.
 
+        Contacts are posted in chunks of ``chunk_size`` so no single request
+        grows unbounded; results are summed across chunks.
+
         Args:
             contacts: List of contact dicts with keys: first_name, last_name, phone, email, etc.
+            chunk_size: Number of contacts per request
 
         Returns:
             Import result with imported/skipped counts
@@ -191,13 +271,27 @@ class CRMClient:
             for c in contacts
         ]
 
-        response = self.session.post(
-            f"{self.base_url}/api/import/contacts",
-            json=payload,
-            timeout=(5, 60),  # Longer timeout for bulk operations
-        )
-        response.raise_for_status()
-        return response.json()["data"]
+        result: dict[str, Any] = {"imported": 0, "skipped": 0, "errors": []}
+        post = self.bulk_session.post
+        url = f"{self.base_url}/api/import/contacts"
+
+        for start in range(0, len(payload), chunk_size):
+            response = post(
+                url,
+                data=orjson.dumps(payload[start : start + chunk_size]),
+                timeout=(5, 60),  # Longer timeout for bulk operations
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)["data"]
+
+            result["imported"] += data["imported"]
+            result["skipped"] += data["skipped"]
+            # Error rows are 1-indexed within the chunk; report them against the full list
+            result["errors"].extend(
+                {**error, "row": error["row"] + start} for error in data.get("errors", [])
+            )
+
+        return result
 
     def create_interaction(self, interaction: Interaction) -> dict[str, Any]:
         """Create a single interaction for a contact.
@@ -208,55 +302,131 @@ class CRMClient:
         Returns:
             Created interaction data
         """
-        payload = {
-            "type": interaction.type,
-            "occurredAt": interaction.occurred_at,
-            "source": interaction.source,
-        }
-
-        if interaction.content:
-            payload["content"] = interaction.content
-        if interaction.duration_seconds:
-            payload["durationSeconds"] = interaction.duration_seconds
-
         response = self.session.post(
             f"{self.base_url}/api/contacts/{interaction.contact_id}/interactions",
-            json=payload,
+            data=orjson.dumps(_interaction_payload(interaction)),
             timeout=(5, 30),
         )
         response.raise_for_status()
-        return response.json()["data"]
+        return orjson.loads(response.content)["data"]
 
     def create_interactions_batch(
-        self, interactions: list[Interaction], batch_size: int = 50
-    ) -> int:
+        self,
+        interactions: list[Interaction],
+        chunk_size: int = 50,
+        workers: int | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> list[bool]:
         """Create multiple interactions in batches.
 
+        Each chunk is posted to the bulk import endpoint in a single request,
+        with up to ``workers`` chunks in flight at once.
+
         Args:
             interactions: List of interactions to create
-            batch_size: Number of interactions per batch
+            chunk_size: Number of interactions per request
+            workers: Maximum number of concurrent batch requests
+                (defaults to ``max_workers``)
+            on_progress: Called with the number of interactions in each chunk
+                as its results arrive (optional)
+
+        Returns:
+            Whether each input interaction was created, in order
+        """
+        it = iter(interactions)
+        results: list[bool] = []
+
+        with ThreadPoolExecutor(max_workers=workers or self.max_workers) as executor:
+            for created in executor.map(
+                self._import_interactions,
+                iter(lambda: list(islice(it, chunk_size)), []),
+            ):
+                results.extend(created)
+                if on_progress:
+                    on_progress(len(created))
+
+        return results
+
+    def _import_interactions(self, interactions: list[Interaction]) -> list[bool]:
+        """Post one chunk of interactions to the bulk import endpoint.
+
+        Args:
+            interactions: Interactions to import
 
         Returns:
-            Number of successfully created interactions
+            Whether each input interaction was imported
         """
-        created = 0
+        payload = [
+            {**_interaction_payload(i), "contactId": i.contact_id} for i in interactions
+        ]
 
-        for interaction in interactions:
-            try:
-                self.create_interaction(interaction)
-                created += 1
-            except requests.exceptions.HTTPError:
-                # Log and continue on individual failures
-                pass
+        try:
+            response = self.bulk_session.post(
+                f"{self.base_url}/api/import/interactions",
+                data=orjson.dumps(payload),
+                timeout=(5, 120),  # Longer timeout for bulk operations
+            )
+            response.raise_for_status()
+            # Error rows are 1-indexed positions within the chunk
+            errors = orjson.loads(response.content)["data"]["errors"]
+            failed = {e["row"] - 1 for e in errors}
+        except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+            # Failed request or unexpected body (e.g. a proxy error page)
+            return [False] * len(interactions)
 
-        return created
+        return [i not in failed for i in range(len(interactions))]
 
     def close(self) -> None:
-        """Close the session."""
+        """Close the sessions."""
         self.session.close()
+        self.bulk_session.close()
 
     def __enter__(self) -> "CRMClient":
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.close()
+
+
+def _contact_payload(contact: Contact) -> dict[str, Any]:
+    """Build the API request body for a contact."""
+    # Optional fields are only sent when set
+    optional = (
+        ("phone", contact.phone),
+        ("email", contact.email),
+        ("organization", contact.organization),
+        ("notes", contact.notes),
+    )
+    return {
+        "firstName": contact.first_name,
+        "lastName": contact.last_name,
+        **{key: value for key, value in optional if value},
+    }
+
+
+def _contact_from_api(data: dict[str, Any]) -> Contact:
+    """Build a Contact from an API response object."""
+    return Contact(
+        data["id"],
+        data["firstName"],
+        data["lastName"],
+        data.get("phone"),
+        data.get("email"),
+        data.get("organization"),
+        data.get("notes"),
+    )
+
+
+def _interaction_payload(interaction: Interaction) -> dict[str, Any]:
+    """Build the API request body for an interaction."""
+    # Optional fields are only sent when set
+    optional = (
+        ("content", interaction.content),
+        ("durationSeconds", interaction.duration_seconds),
+    )
+    return {
+        "type": interaction.type,
+        "occurredAt": interaction.occurred_at,
+        "source": interaction.source,
+        **{key: value for key, value in optional if value},
+    }
@@ -9,6 +9,23 @@ from typing import Iterator
 # Apple epoch offset (same as messages.py)
 APPLE_EPOCH_OFFSET = 978307200
 
+_UTC = timezone.utc
+
+# Largest exclude set passed to SQLite as inline NOT IN (...) parameters;
+# larger sets are loaded into a temp table
+MAX_INLINE_EXCLUDES = 500
+
+# Rows fetched from SQLite per fetchmany() call
+FETCH_BATCH_SIZE = 10_000
+
+# Interaction type keyed by (answered, is_incoming)
+_CALL_TYPE_MAP = {
+    (False, False): "CALL_MISSED",
+    (False, True): "CALL_MISSED",
+    (True, True): "CALL_INBOUND",
+    (True, False): "CALL_OUTBOUND",
+}
+
 
 @dataclass
 class CallRecord:
@@ -37,8 +54,7 @@ def apple_timestamp_to_datetime(apple_ts: float | None) -> datetime | None:
         return None
 
     try:
-        unix_ts = apple_ts + APPLE_EPOCH_OFFSET
-        return datetime.fromtimestamp(unix_ts, tz=timezone.utc)
+        return datetime.fromtimestamp(apple_ts + APPLE_EPOCH_OFFSET, _UTC)
     except (OSError, OverflowError, ValueError):
         return None
 
@@ -55,8 +71,9 @@ def datetime_to_apple_timestamp(dt: datetime | None) -> float:
     if dt is None:
         return 0.0
 
+    # Aware datetimes convert directly; only naive ones need a tz attached
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=_UTC)
 
     return dt.timestamp() - APPLE_EPOCH_OFFSET
 
@@ -81,19 +98,27 @@ def open_calls_database() -> sqlite3.Connection:
         f"file:{db_path}?immutable=1",
         uri=True,
     )
-    conn.row_factory = sqlite3.Row
+
+    # Tune for large read-only scans: memory-map the file (256 MB), keep a
+    # ~64 MB page cache, and keep temp tables in memory
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
 
 def read_calls(
     since_timestamp: float | None = None,
     exclude_rowids: set[int] | None = None,
+    synced_db: Path | None = None,
 ) -> Iterator[CallRecord]:
     """Read call records from the Call History database.
 
     Args:
         since_timestamp: Apple timestamp to filter calls after (optional)
         exclude_rowids: Set of ROWIDs to skip (already synced)
+        synced_db: Sync state database whose synced_calls table lists
+            more ROWIDs to skip (optional)
 
     Yields:
         CallRecord for each call
@@ -115,6 +140,8 @@ def read_calls(
                 ZANSWERED
             FROM ZCALLRECORD
             WHERE ZADDRESS IS NOT NULL
+              AND ZDATE IS NOT NULL
+              AND ZDATE != 0
         """
         params: list = []
 
@@ -122,29 +149,49 @@ def read_calls(
             query += " AND ZDATE > ?"
             params.append(since_timestamp)
 
+        # Let SQLite skip previously synced calls with an anti-join
+        if synced_db:
+            conn.execute("ATTACH DATABASE ? AS synced", (f"file:{synced_db}?mode=ro",))
+            query += " AND Z_PK NOT IN (SELECT rowid FROM synced.synced_calls)"
+
+        # Skip already synced calls in SQL: small sets inline, large sets
+        # via a temp table so we stay under SQLite's parameter limit
+        if len(exclude_rowids) > MAX_INLINE_EXCLUDES:
+            conn.execute("CREATE TEMP TABLE excluded_calls (rowid INTEGER PRIMARY KEY)")
+            conn.executemany(
+                "INSERT INTO excluded_calls VALUES (?)",
+                ((rowid,) for rowid in exclude_rowids),
+            )
+            query += " AND Z_PK NOT IN (SELECT rowid FROM excluded_calls)"
+        elif exclude_rowids:
+            query += f" AND Z_PK NOT IN ({', '.join('?' * len(exclude_rowids))})"
+            params.extend(exclude_rowids)
+
         query += " ORDER BY ZDATE"
 
         cursor = conn.execute(query, params)
-
-        for row in cursor:
-            rowid = row["Z_PK"]
-
-            # Skip already synced calls
-            if rowid in exclude_rowids:
-                continue
-
-            date = apple_timestamp_to_datetime(row["ZDATE"])
-            if date is None:
-                continue
-
-            yield CallRecord(
-                rowid=rowid,
-                phone=row["ZADDRESS"],
-                date=date,
-                duration=int(row["ZDURATION"] or 0),
-                call_type=int(row["ZCALLTYPE"] or 0),
-                answered=bool(row["ZANSWERED"]),
-            )
+        cursor.arraysize = FETCH_BATCH_SIZE
+
+        # Bind hot-loop globals as locals
+        from_timestamp = datetime.fromtimestamp
+        utc = _UTC
+
+        while rows := cursor.fetchmany():
+            for rowid, address, zdate, zduration, zcalltype, zanswered in rows:
+                # Inlined apple_timestamp_to_datetime (NULL/0 dates filtered in SQL)
+                try:
+                    date = from_timestamp(zdate + APPLE_EPOCH_OFFSET, utc)
+                except (OSError, OverflowError, ValueError):
+                    continue
+
+                yield CallRecord(
+                    rowid=rowid,
+                    phone=address,
+                    date=date,
+                    duration=int(zduration or 0),
+                    call_type=int(zcalltype or 0),
+                    answered=bool(zanswered),
+                )
 
     finally:
         conn.close()
@@ -182,10 +229,4 @@ def get_call_type(call_type: int, answered: bool) -> str:
     Returns:
         Interaction type string
     """
-    if not answered:
-        return "CALL_MISSED"
-
-    if call_type == 1:
-        return "CALL_INBOUND"
-
-    return "CALL_OUTBOUND"
+    return _CALL_TYPE_MAP[(bool(answered), call_type == 1)]
@@ -1,12 +1,17 @@
 """CLI entry point for CRM sync."""
 
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+from typing import Callable
 
 import click
 
 from .api import CRMClient, Contact, Interaction
 from .calls import (
+    CallRecord,
     check_calls_access,
     datetime_to_apple_timestamp as calls_dt_to_apple,
     get_call_type,
@@ -15,6 +20,7 @@ from .calls import (
 from .config import Config, SyncState
 from .contacts import check_contacts_access, find_contacts_database, read_contacts
 from .messages import (
+    Message,
     check_messages_access,
     datetime_to_apple_timestamp as messages_dt_to_apple,
     get_message_type,
@@ -22,6 +28,9 @@ from .messages import (
 )
 from .phone import format_phone_display, normalize_phone, strip_phone_formatting
 
+# Messages/calls are matched and synced this many at a time
+SYNC_WINDOW_SIZE = 500
+
 
 def log_success(message: str) -> None:
     """Print a success message in green."""
@@ -188,55 +197,41 @@ def _sync_contacts(
         log_warning("No contacts database found")
         return
 
-    # Read local contacts
-    local_contacts = list(read_contacts(db_path))
-    log_info(f"Found {len(local_contacts)} contacts in macOS Contacts")
-
     # Fetch existing CRM contacts (skip in dry-run mode)
     if dry_run:
+        local_count = sum(1 for _ in read_contacts(db_path))
+        log_info(f"Found {local_count} contacts in macOS Contacts")
         log_warning("Skipping CRM fetch (dry run)")
-        log_warning(f"Would process {len(local_contacts)} contacts for sync")
-        stats["contacts_created"] = len(local_contacts)
+        log_warning(f"Would process {local_count} contacts for sync")
+        stats["contacts_created"] = local_count
         return
 
-    existing_contacts = client.get_all_contacts()
-    log_info(f"Found {len(existing_contacts)} contacts in CRM")
-
-    # Build lookup maps from existing contacts
-    for contact in existing_contacts:
-        if contact.phone:
-            normalized = normalize_phone(contact.phone, config.default_region)
-            if normalized:
-                state.phone_to_contact_id[normalized] = contact.id
-            # Also store stripped version for fuzzy matching
-            stripped = strip_phone_formatting(contact.phone)
-            if stripped:
-                state.phone_to_contact_id[stripped] = contact.id
+    # Fetch CRM contacts in the background while the local reader loads;
+    # its first record arrives once all phones and emails have been read
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        crm_fetch = executor.submit(_index_crm_contacts, client, config, state)
+        local_contacts = read_contacts(db_path)
+        first = next(local_contacts, None)
+        existing_count = crm_fetch.result()
 
-        if contact.email:
-            state.email_to_contact_id[contact.email.lower()] = contact.id
+    log_info(f"Found {existing_count} contacts in CRM")
 
-    # Find new contacts to create
+    # Stream local contacts and find new ones to create
+    local_count = 0
     new_contacts = []
-    for local in local_contacts:
+    for local in chain([first] if first else [], local_contacts):
+        local_count += 1
+
         # Check if any phone or email already exists
-        is_duplicate = False
-
-        for phone in local.phones:
-            normalized = normalize_phone(phone, config.default_region)
-            if normalized and normalized in state.phone_to_contact_id:
-                is_duplicate = True
-                break
-            stripped = strip_phone_formatting(phone)
-            if stripped and stripped in state.phone_to_contact_id:
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
-            for email in local.emails:
-                if email.lower() in state.email_to_contact_id:
-                    is_duplicate = True
-                    break
+        phone_keys = {normalize_phone(phone, config.default_region) for phone in local.phones}
+        phone_keys.update(strip_phone_formatting(phone) for phone in local.phones)
+        phone_keys.discard(None)
+        email_keys = {email.lower() for email in local.emails}
+
+        is_duplicate = not (
+            state.phone_to_contact_id.keys().isdisjoint(phone_keys)
+            and state.email_to_contact_id.keys().isdisjoint(email_keys)
+        )
 
         if is_duplicate:
             stats["contacts_existing"] += 1
@@ -262,14 +257,19 @@ def _sync_contacts(
 
         primary_email = local.emails[0] if local.emails else None
 
-        new_contacts.append({
-            "first_name": first_name,
-            "last_name": last_name,
-            "phone": primary_phone,
-            "email": primary_email,
-            "organization": local.organization,
-            "notes": local.notes,
-        })
+        new_contacts.append(
+            Contact(
+                id=None,
+                first_name=first_name,
+                last_name=last_name,
+                phone=primary_phone,
+                email=primary_email,
+                organization=local.organization,
+                notes=local.notes,
+            )
+        )
+
+    log_info(f"Found {local_count} contacts in macOS Contacts")
 
     if dry_run:
         log_warning(f"Would create {len(new_contacts)} new contacts (dry run)")
@@ -278,37 +278,63 @@ def _sync_contacts(
 
     # Create contacts
     if new_contacts:
-        with click.progressbar(new_contacts, label="  Creating contacts") as bar:
-            for contact_data in bar:
-                try:
-                    contact = Contact(
-                        id=None,
-                        first_name=contact_data["first_name"],
-                        last_name=contact_data["last_name"],
-                        phone=contact_data.get("phone"),
-                        email=contact_data.get("email"),
-                        organization=contact_data.get("organization"),
-                        notes=contact_data.get("notes"),
-                    )
-                    created = client.create_contact(contact)
-                    stats["contacts_created"] += 1
-
-                    # Update lookup maps
-                    if created.phone:
-                        normalized = normalize_phone(created.phone, config.default_region)
-                        if normalized:
-                            state.phone_to_contact_id[normalized] = created.id
-                    if created.email:
-                        state.email_to_contact_id[created.email.lower()] = created.id
-
-                except Exception as e:
-                    if verbose:
-                        log_error(f"Failed to create contact: {e}")
+        log_info(f"Creating {len(new_contacts)} new contacts")
+        failed = 0
+
+        with click.progressbar(length=len(new_contacts), label="  Creating contacts") as bar:
+            results = client.create_contacts_batch(new_contacts, on_progress=bar.update)
+
+        for created in results:
+            if created is None:
+                failed += 1
+                continue
+
+            stats["contacts_created"] += 1
+
+            # Update lookup maps
+            if created.phone:
+                normalized = normalize_phone(created.phone, config.default_region)
+                if normalized:
+                    state.phone_to_contact_id[normalized] = created.id
+            if created.email:
+                state.email_to_contact_id[created.email.lower()] = created.id
+
+        if failed and verbose:
+            log_error(f"Failed to create {failed} contacts")
 
     state.last_contacts_sync = datetime.now(timezone.utc)
     log_success(f"Created {stats['contacts_created']} new contacts")
 
 
+def _index_crm_contacts(client: CRMClient, config: Config, state: SyncState) -> int:
+    """Build lookup maps from existing CRM contacts as pages arrive.
+
+    Args:
+        client: CRM API client
+        config: Configuration
+        state: Sync state with lookup maps to fill
+
+    Returns:
+        Number of contacts in the CRM
+    """
+    existing_count = 0
+    for contact in client.iter_all_contacts():
+        existing_count += 1
+        if contact.phone:
+            normalized = normalize_phone(contact.phone, config.default_region)
+            if normalized:
+                state.phone_to_contact_id[normalized] = contact.id
+            # Also store stripped version for fuzzy matching
+            stripped = strip_phone_formatting(contact.phone)
+            if stripped:
+                state.phone_to_contact_id[stripped] = contact.id
+
+        if contact.email:
+            state.email_to_contact_id[contact.email.lower()] = contact.id
+
+    return existing_count
+
+
 def _sync_messages(
     client: CRMClient,
     config: Config,
@@ -330,68 +356,84 @@ def _sync_messages(
     # Calculate since timestamp
     since_ts = messages_dt_to_apple(lookback_date)
 
-    # Read messages
-    messages = list(
-        read_messages(
-            since_timestamp=since_ts,
-            exclude_guids=state.synced_message_guids,
-        )
-    )
-    log_info(f"Found {len(messages)} messages in lookback period")
-
-    # Match messages to contacts
-    matched = []
+    # Stream messages, syncing matched ones a window at a time
+    found = 0
+    matched_count = 0
+    # Unmatched records grouped by normalized handle, so differently formatted
+    # handles for the same number share one unknown contact. Only kept when
+    # unknown contacts will be created, so memory stays bounded otherwise.
+    create_unknowns = not known_only and config.create_unknown_contacts
+    unmatched_by_handle = defaultdict(list)
+    # A dry run only counts the unknown contacts, so it keeps just the keys
     unmatched_handles = set()
 
-    for msg in messages:
-        contact_id = _find_contact_for_handle(msg.handle, state, config)
+    messages = read_messages(
+        since_timestamp=since_ts,
+        exclude_guids=state.synced_message_guids,
+        synced_db=state.synced_ids_db(),
+    )
+    # Report progress per record read; length is unknown while streaming
+    with click.progressbar(
+        messages,
+        label="  Syncing messages",
+        show_pos=True,
+        update_min_steps=SYNC_WINDOW_SIZE,
+    ) as bar:
+        records = iter(bar)
+        for window in iter(lambda: list(islice(records, SYNC_WINDOW_SIZE)), []):
+            found += len(window)
+            matched = []
+
+            for msg in window:
+                contact_id = _find_contact_for_handle(msg.handle, msg.handle_kind, state, config)
+
+                if contact_id:
+                    matched.append((msg, contact_id))
+                elif create_unknowns:
+                    key = _handle_key(msg.handle, config)
+                    if dry_run:
+                        unmatched_handles.add(key)
+                    else:
+                        unmatched_by_handle[key].append(msg)
 
-        if contact_id:
-            matched.append((msg, contact_id))
-        else:
-            unmatched_handles.add(msg.handle)
+            matched_count += len(matched)
+            if not dry_run:
+                _create_message_interactions(client, state, stats, matched, verbose)
 
-    log_info(f"Matched {len(matched)} to known contacts")
+    log_info(f"Found {found} messages in lookback period")
+    log_info(f"Matched {matched_count} to known contacts")
 
     # Handle unknown contacts
-    if unmatched_handles and not known_only and config.create_unknown_contacts:
-        log_info(f"Creating {len(unmatched_handles)} unknown contacts for unmatched handles")
+    unknown_count = len(unmatched_handles) if dry_run else len(unmatched_by_handle)
+    if unknown_count:
+        log_info(f"Creating {unknown_count} unknown contacts for unmatched handles")
         if not dry_run:
-            for handle in unmatched_handles:
-                contact_id = _create_unknown_contact(
-                    client, handle, state, config, verbose
+            # Each group's unknown contact is built from its first raw handle
+            groups = list(unmatched_by_handle.values())
+            created_ids = _create_unknown_contacts(
+                client, [group[0].handle for group in groups], state, config, verbose
+            )
+            matched = []
+            for group in groups:
+                contact_id = created_ids.get(group[0].handle)
+                if not contact_id:
+                    continue
+                stats["contacts_unknown"] += 1
+                # Re-match messages for this handle
+                matched.extend((msg, contact_id) for msg in group)
+
+            with click.progressbar(
+                length=len(matched), label="  Syncing messages for unknown contacts"
+            ) as bar:
+                _create_message_interactions(
+                    client, state, stats, matched, verbose, on_progress=bar.update
                 )
-                if contact_id:
-                    stats["contacts_unknown"] += 1
-                    # Re-match messages for this handle
-                    for msg in messages:
-                        if msg.handle == handle:
-                            matched.append((msg, contact_id))
 
     if dry_run:
-        log_warning(f"Would sync {len(matched)} message interactions (dry run)")
-        stats["messages_synced"] = len(matched)
+        log_warning(f"Would sync {matched_count} message interactions (dry run)")
+        stats["messages_synced"] = matched_count
         return
 
-    # Create interactions
-    if matched:
-        with click.progressbar(matched, label="  Syncing messages") as bar:
-            for msg, contact_id in bar:
-                try:
-                    interaction = Interaction(
-                        contact_id=contact_id,
-                        type=get_message_type(msg.is_from_me),
-                        occurred_at=msg.date.isoformat(),
-                        content=None,
-                        source="IMPORT_IOS",
-                    )
-                    client.create_interaction(interaction)
-                    state.synced_message_guids.add(msg.guid)
-                    stats["messages_synced"] += 1
-                except Exception as e:
-                    if verbose:
-                        log_error(f"Failed to create interaction: {e}")
-
     state.last_messages_sync = datetime.now(timezone.utc)
     log_success(f"Synced {stats['messages_synced']} message interactions")
 
@@ -417,88 +459,195 @@ def _sync_calls(
     # Calculate since timestamp
     since_ts = calls_dt_to_apple(lookback_date)
 
-    # Read calls
-    calls = list(
-        read_calls(
-            since_timestamp=since_ts,
-            exclude_rowids=state.synced_call_ids,
-        )
-    )
-    log_info(f"Found {len(calls)} calls in lookback period")
-
-    # Match calls to contacts
-    matched = []
+    # Stream calls, syncing matched ones a window at a time
+    found = 0
+    matched_count = 0
+    # Unmatched records grouped by normalized phone, so differently formatted
+    # phones for the same number share one unknown contact. Only kept when
+    # unknown contacts will be created, so memory stays bounded otherwise.
+    create_unknowns = not known_only and config.create_unknown_contacts
+    unmatched_by_phone = defaultdict(list)
+    # A dry run only counts the unknown contacts, so it keeps just the keys
     unmatched_phones = set()
 
-    for call in calls:
-        contact_id = _find_contact_for_phone(call.phone, state, config)
+    calls = read_calls(
+        since_timestamp=since_ts,
+        exclude_rowids=state.synced_call_ids,
+        synced_db=state.synced_ids_db(),
+    )
+    # Report progress per record read; length is unknown while streaming
+    with click.progressbar(
+        calls,
+        label="  Syncing calls",
+        show_pos=True,
+        update_min_steps=SYNC_WINDOW_SIZE,
+    ) as bar:
+        records = iter(bar)
+        for window in iter(lambda: list(islice(records, SYNC_WINDOW_SIZE)), []):
+            found += len(window)
+            matched = []
+
+            for call in window:
+                contact_id = _find_contact_for_phone(call.phone, state, config)
 
-        if contact_id:
-            matched.append((call, contact_id))
-        else:
-            unmatched_phones.add(call.phone)
+                if contact_id:
+                    matched.append((call, contact_id))
+                elif create_unknowns:
+                    key = _handle_key(call.phone, config)
+                    if dry_run:
+                        unmatched_phones.add(key)
+                    else:
+                        unmatched_by_phone[key].append(call)
 
-    log_info(f"Matched {len(matched)} to known contacts")
+            matched_count += len(matched)
+            if not dry_run:
+                _create_call_interactions(client, state, stats, matched, verbose)
+
+    log_info(f"Found {found} calls in lookback period")
+    log_info(f"Matched {matched_count} to known contacts")
 
     # Handle unknown contacts
-    if unmatched_phones and not known_only and config.create_unknown_contacts:
-        log_info(f"Creating {len(unmatched_phones)} unknown contacts for unmatched phones")
+    unknown_count = len(unmatched_phones) if dry_run else len(unmatched_by_phone)
+    if unknown_count:
+        log_info(f"Creating {unknown_count} unknown contacts for unmatched phones")
         if not dry_run:
-            for phone in unmatched_phones:
-                contact_id = _create_unknown_contact(
-                    client, phone, state, config, verbose
+            # Each group's unknown contact is built from its first raw phone
+            groups = list(unmatched_by_phone.values())
+            created_ids = _create_unknown_contacts(
+                client, [group[0].phone for group in groups], state, config, verbose
+            )
+            matched = []
+            for group in groups:
+                contact_id = created_ids.get(group[0].phone)
+                if not contact_id:
+                    continue
+                stats["contacts_unknown"] += 1
+                # Re-match calls for this phone
+                matched.extend((call, contact_id) for call in group)
+
+            with click.progressbar(
+                length=len(matched), label="  Syncing calls for unknown contacts"
+            ) as bar:
+                _create_call_interactions(
+                    client, state, stats, matched, verbose, on_progress=bar.update
                 )
-                if contact_id:
-                    stats["contacts_unknown"] += 1
-                    # Re-match calls for this phone
-                    for call in calls:
-                        if call.phone == phone:
-                            matched.append((call, contact_id))
 
     if dry_run:
-        log_warning(f"Would sync {len(matched)} call interactions (dry run)")
-        stats["calls_synced"] = len(matched)
+        log_warning(f"Would sync {matched_count} call interactions (dry run)")
+        stats["calls_synced"] = matched_count
         return
 
-    # Create interactions
-    if matched:
-        with click.progressbar(matched, label="  Syncing calls") as bar:
-            for call, contact_id in bar:
-                try:
-                    interaction = Interaction(
-                        contact_id=contact_id,
-                        type=get_call_type(call.call_type, call.answered),
-                        occurred_at=call.date.isoformat(),
-                        content=None,
-                        duration_seconds=call.duration if call.duration > 0 else None,
-                        source="IMPORT_IOS",
-                    )
-                    client.create_interaction(interaction)
-                    state.synced_call_ids.add(call.rowid)
-                    stats["calls_synced"] += 1
-                except Exception as e:
-                    if verbose:
-                        log_error(f"Failed to create interaction: {e}")
-
     state.last_calls_sync = datetime.now(timezone.utc)
     log_success(f"Synced {stats['calls_synced']} call interactions")
 
 
+def _create_message_interactions(
+    client: CRMClient,
+    state: SyncState,
+    stats: dict,
+    matched: list[tuple[Message, int]],
+    verbose: bool,
+    on_progress: Callable[[int], None] | None = None,
+) -> None:
+    """Create interactions for matched messages and record them as synced.
+
+    Args:
+        client: CRM API client
+        state: Sync state
+        stats: Sync statistics to update
+        matched: Messages paired with their contact IDs
+        verbose: Whether to log errors
+        on_progress: Called with the size of each uploaded batch (optional)
+    """
+    if not matched:
+        return
+
+    interactions = [
+        Interaction(
+            contact_id=contact_id,
+            type=get_message_type(msg.is_from_me),
+            occurred_at=msg.date,
+            content=None,
+            source="IMPORT_IOS",
+        )
+        for msg, contact_id in matched
+    ]
+    results = client.create_interactions_batch(interactions, on_progress=on_progress)
+
+    synced = 0
+    for (msg, _), created in zip(matched, results):
+        if created:
+            state.synced_message_guids.add(msg.guid)
+            synced += 1
+
+    stats["messages_synced"] += synced
+    failed = len(matched) - synced
+    if failed and verbose:
+        log_error(f"Failed to create {failed} message interactions")
+
+
+def _create_call_interactions(
+    client: CRMClient,
+    state: SyncState,
+    stats: dict,
+    matched: list[tuple[CallRecord, int]],
+    verbose: bool,
+    on_progress: Callable[[int], None] | None = None,
+) -> None:
+    """Create interactions for matched calls and record them as synced.
+
+    Args:
+        client: CRM API client
+        state: Sync state
+        stats: Sync statistics to update
+        matched: Calls paired with their contact IDs
+        verbose: Whether to log errors
+        on_progress: Called with the size of each uploaded batch (optional)
+    """
+    if not matched:
+        return
+
+    interactions = [
+        Interaction(
+            contact_id=contact_id,
+            type=get_call_type(call.call_type, call.answered),
+            occurred_at=call.date,
+            content=None,
+            duration_seconds=call.duration if call.duration > 0 else None,
+            source="IMPORT_IOS",
+        )
+        for call, contact_id in matched
+    ]
+    results = client.create_interactions_batch(interactions, on_progress=on_progress)
+
+    synced = 0
+    for (call, _), created in zip(matched, results):
+        if created:
+            state.synced_call_ids.add(call.rowid)
+            synced += 1
+
+    stats["calls_synced"] += synced
+    failed = len(matched) - synced
+    if failed and verbose:
+        log_error(f"Failed to create {failed} call interactions")
+
+
 def _find_contact_for_handle(
-    handle: str, state: SyncState, config: Config
+    handle: str, handle_kind: str, state: SyncState, config: Config
 ) -> int | None:
     """Find contact ID for a message handle (phone or email).
 
     Args:
         handle: Phone number or email address
+        handle_kind: "phone" or "email", as tagged by read_messages
         state: Sync state with lookup maps
         config: Configuration
 
     Returns:
         Contact ID or None
     """
-    # Try as email first
-    if "@" in handle:
+    # Only emails need lowercasing
+    if handle_kind == "email":
         return state.email_to_contact_id.get(handle.lower())
 
     # Try as phone
@@ -518,41 +667,102 @@ def _find_contact_for_phone(
     Returns:
         Contact ID or None
     """
+    # Handles repeat across messages and calls, so remember each match
+    contact_id = state.handle_index.get(phone)
+    if contact_id:
+        return contact_id
+
     # Try normalized
     normalized = normalize_phone(phone, config.default_region)
     if normalized:
         contact_id = state.phone_to_contact_id.get(normalized)
-        if contact_id:
-            return contact_id
 
     # Try stripped
-    stripped = strip_phone_formatting(phone)
-    if stripped:
-        contact_id = state.phone_to_contact_id.get(stripped)
-        if contact_id:
-            return contact_id
+    if not contact_id:
+        stripped = strip_phone_formatting(phone)
+        if stripped:
+            contact_id = state.phone_to_contact_id.get(stripped)
 
-    return None
+    if not contact_id:
+        return None
+
+    state.handle_index[phone] = contact_id
+    return contact_id
+
+
+def _handle_key(handle: str, config: Config) -> str:
+    """Get the grouping key for a phone or email handle.
+
+    Args:
+        handle: Phone number or email address
+        config: Configuration
+
+    Returns:
+        Lowercased email, E.164 phone, or the raw handle if it won't normalize
+    """
+    if "@" in handle:
+        return handle.lower()
+
+    return normalize_phone(handle, config.default_region) or handle
 
 
-def _create_unknown_contact(
+def _create_unknown_contacts(
     client: CRMClient,
-    handle: str,
+    handles: list[str],
     state: SyncState,
     config: Config,
     verbose: bool,
-) -> int | None:
-    """Create a placeholder contact for an unknown handle.
+) -> dict[str, int]:
+    """Create placeholder contacts for unknown handles.
 
     Args:
         client: CRM API client
-        handle: Phone number or email
+        handles: Phone numbers or emails
         state: Sync state
         config: Configuration
         verbose: Whether to log errors
 
     Returns:
-        Created contact ID or None
+        Dict of handle to created contact ID (failed handles are omitted)
+    """
+    contacts = [_unknown_contact(handle, config) for handle in handles]
+    created_ids = {}
+
+    with click.progressbar(length=len(contacts), label="  Creating unknown contacts") as bar:
+        results = client.create_contacts_batch(contacts, on_progress=bar.update)
+
+    for handle, created in zip(handles, results):
+        if created is None:
+            if verbose:
+                log_error(f"Failed to create unknown contact for {handle}")
+            continue
+
+        # Update lookup maps
+        if created.phone:
+            normalized = normalize_phone(created.phone, config.default_region)
+            if normalized:
+                state.phone_to_contact_id[normalized] = created.id
+            stripped = strip_phone_formatting(created.phone)
+            if stripped:
+                state.phone_to_contact_id[stripped] = created.id
+
+        if created.email:
+            state.email_to_contact_id[created.email.lower()] = created.id
+
+        created_ids[handle] = created.id
+
+    return created_ids
+
+
+def _unknown_contact(handle: str, config: Config) -> Contact:
+    """Build a placeholder contact for an unknown handle.
+
+    Args:
+        handle: Phone number or email
+        config: Configuration
+
+    Returns:
+        Contact ready to be created
     """
     # Determine if phone or email
     is_email = "@" in handle
@@ -573,35 +783,14 @@ def _create_unknown_contact(
         phone = normalize_phone(handle, config.default_region) or handle
         email = None
 
-    try:
-        contact = Contact(
-            id=None,
-            first_name=first_name,
-            last_name=last_name,
-            phone=phone,
-            email=email,
-            notes="Auto-created from iOS sync - needs review",
-        )
-        created = client.create_contact(contact)
-
-        # Update lookup maps
-        if created.phone:
-            normalized = normalize_phone(created.phone, config.default_region)
-            if normalized:
-                state.phone_to_contact_id[normalized] = created.id
-            stripped = strip_phone_formatting(created.phone)
-            if stripped:
-                state.phone_to_contact_id[stripped] = created.id
-
-        if created.email:
-            state.email_to_contact_id[created.email.lower()] = created.id
-
-        return created.id
-
-    except Exception as e:
-        if verbose:
-            log_error(f"Failed to create unknown contact for {handle}: {e}")
-        return None
+    return Contact(
+        id=None,
+        first_name=first_name,
+        last_name=last_name,
+        phone=phone,
+        email=email,
+        notes="Auto-created from iOS sync - needs review",
+    )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
 """Configuration and state management for CRM sync."""
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 CONFIG_PATH = Path.home() / ".crm-sync-config.json"
 STATE_PATH = Path.home() / ".crm-sync-state.json"
+STATE_DB_PATH = Path.home() / ".crm-sync-state.db"
 
 DEFAULT_CONFIG = {
     "api_url": "http://localhost:3001",
@@ -18,7 +22,7 @@ DEFAULT_CONFIG = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Sync configuration loaded from ~/.crm-sync-config.json."""
 
@@ -51,9 +55,14 @@ class Config:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncState:
-    """Sync state stored in ~/.crm-sync-state.json."""
+    """Sync state stored in ~/.crm-sync-state.json.
+
+    Synced message GUIDs and call IDs grow with every run, so they live in
+    ~/.crm-sync-state.db. The in-memory sets only hold IDs synced since the
+    last save; readers filter against the database directly.
+    """
 
     last_contacts_sync: datetime | None = None
     last_messages_sync: datetime | None = None
@@ -62,38 +71,77 @@ class SyncState:
     synced_call_ids: set[int] = field(default_factory=set)
     phone_to_contact_id: dict[str, int] = field(default_factory=dict)
     email_to_contact_id: dict[str, int] = field(default_factory=dict)
+    # Raw phone handle -> contact ID, memoized during a run (not persisted)
+    handle_index: dict[str, int] = field(default_factory=dict)
+    # Whether stored synced IDs should be dropped on save (full resync)
+    _clear_synced_ids: bool = field(default=False, init=False, repr=False)
 
     @classmethod
     def load(cls) -> "SyncState":
         """Load state from file, returning empty state if missing."""
         if not STATE_PATH.exists():
-            return cls()
+            # Deleting the state file forces a full resync
+            state = cls()
+            state._clear_synced_ids = True
+            return state
 
-        with open(STATE_PATH) as f:
-            data = json.load(f)
+        data = orjson.loads(STATE_PATH.read_bytes())
 
         return cls(
             last_contacts_sync=_parse_datetime(data.get("last_contacts_sync")),
             last_messages_sync=_parse_datetime(data.get("last_messages_sync")),
             last_calls_sync=_parse_datetime(data.get("last_calls_sync")),
+            # Older state files keep synced IDs inline; migrated on next save
             synced_message_guids=set(data.get("synced_message_guids", [])),
             synced_call_ids=set(data.get("synced_call_ids", [])),
             phone_to_contact_id=data.get("phone_to_contact_id", {}),
             email_to_contact_id=data.get("email_to_contact_id", {}),
         )
 
+    def synced_ids_db(self) -> Path | None:
+        """Get the synced-ID store that readers should filter against.
+
+        Returns:
+            Path to ~/.crm-sync-state.db, or None if it doesn't exist or a
+            full resync is pending
+        """
+        if self._clear_synced_ids or not STATE_DB_PATH.exists():
+            return None
+        return STATE_DB_PATH
+
     def save(self) -> None:
         """Save state to file."""
         data = {
             "last_contacts_sync": _format_datetime(self.last_contacts_sync),
             "last_messages_sync": _format_datetime(self.last_messages_sync),
             "last_calls_sync": _format_datetime(self.last_calls_sync),
-            "synced_message_guids": list(self.synced_message_guids),
-            "synced_call_ids": list(self.synced_call_ids),
             "phone_to_contact_id": self.phone_to_contact_id,
             "email_to_contact_id": self.email_to_contact_id,
         }
-        STATE_PATH.write_text(json.dumps(data, indent=2))
+
+        # Append newly synced IDs in a single transaction
+        conn = _open_state_db()
+        try:
+            with conn:
+                if self._clear_synced_ids:
+                    conn.execute("DELETE FROM synced_messages")
+                    conn.execute("DELETE FROM synced_calls")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO synced_messages VALUES (?)",
+                    ((guid,) for guid in self.synced_message_guids),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO synced_calls VALUES (?)",
+                    ((rowid,) for rowid in self.synced_call_ids),
+                )
+        finally:
+            conn.close()
+
+        self.synced_message_guids.clear()
+        self.synced_call_ids.clear()
+        self._clear_synced_ids = False
+
+        STATE_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     def clear(self) -> None:
         """Clear all sync state for full resync."""
@@ -102,9 +150,20 @@ class SyncState:
         self.last_calls_sync = None
         self.synced_message_guids.clear()
         self.synced_call_ids.clear()
+        self._clear_synced_ids = True
         # Keep contact mappings - they're still valid
 
 
+def _open_state_db() -> sqlite3.Connection:
+    """Open the synced-ID store, creating its tables if needed."""
+    conn = sqlite3.connect(STATE_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS synced_messages (guid TEXT PRIMARY KEY) WITHOUT ROWID"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS synced_calls (rowid INTEGER PRIMARY KEY)")
+    return conn
+
+
 def _parse_datetime(value: str | None) -> datetime | None:
     """Parse ISO datetime string."""
     if value is None:
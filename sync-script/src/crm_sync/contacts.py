@@ -1,12 +1,13 @@
 """macOS Contacts database reader."""
 
 import sqlite3
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalContact:
     """Contact data from macOS Contacts database."""
 
@@ -57,6 +58,13 @@ def open_database_safely(db_path: Path) -> sqlite3.Connection:
         uri=True,
     )
     conn.row_factory = sqlite3.Row
+
+    # Read-only workload: memory-map the file (256 MB), keep a ~20 MB page
+    # cache and temp data in memory, and refuse any writes
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA query_only = 1")
     return conn
 
 
@@ -91,79 +99,71 @@ def read_contacts(db_path: Path) -> Iterator[LocalContact]:
 
         contacts = list(cursor)
 
+        # Fetch all phones and emails in one query each, grouped by owner
+        phones = _get_all_phones(conn)
+        emails = _get_all_emails(conn)
+
         for row in contacts:
             rowid = row["Z_PK"]
 
-            # Get phone numbers for this contact
-            phones = _get_phones(conn, rowid)
-
-            # Get emails for this contact
-            emails = _get_emails(conn, rowid)
-
             yield LocalContact(
                 rowid=rowid,
                 first_name=row["ZFIRSTNAME"],
                 last_name=row["ZLASTNAME"],
                 organization=row["ZORGANIZATION"],
                 notes=row["ZNOTE"],
-                phones=phones,
-                emails=emails,
+                phones=phones.get(rowid, []),
+                emails=emails.get(rowid, []),
             )
 
     finally:
         conn.close()
 
 
-def _get_phones(conn: sqlite3.Connection, owner_id: int) -> list[str]:
-    """Get all phone numbers for a contact.
+def _get_all_phones(conn: sqlite3.Connection) -> dict[int, list[str]]:
+    """Get all phone numbers, grouped by contact.
 
     Args:
         conn: Database connection
-        owner_id: ROWID of the contact
 
     Returns:
-        List of phone number strings
+        Dict of contact ROWID to list of phone number strings
     """
     cursor = conn.execute(
         """
-        SELECT ZFULLNUMBER
+        SELECT ZOWNER, ZFULLNUMBER
         FROM ZABCDPHONENUMBER
-        WHERE ZOWNER = ?
-        """,
-        (owner_id,),
+        WHERE ZFULLNUMBER IS NOT NULL AND ZFULLNUMBER != ''
+        """
     )
 
-    phones = []
-    for row in cursor:
-        if row["ZFULLNUMBER"]:
-            phones.append(row["ZFULLNUMBER"])
+    phones: dict[int, list[str]] = defaultdict(list)
+    for owner_id, number in cursor:
+        phones[owner_id].append(number)
 
     return phones
 
 
-def _get_emails(conn: sqlite3.Connection, owner_id: int) -> list[str]:
-    """Get all email addresses for a contact.
+def _get_all_emails(conn: sqlite3.Connection) -> dict[int, list[str]]:
+    """Get all email addresses, grouped by contact.
 
     Args:
         conn: Database connection
-        owner_id: ROWID of the contact
 
     Returns:
-        List of email strings
+        Dict of contact ROWID to list of lowercased email strings
     """
     cursor = conn.execute(
         """
-        SELECT ZADDRESS
+        SELECT ZOWNER, ZADDRESS
         FROM ZABCDEMAILADDRESS
-        WHERE ZOWNER = ?
-        """,
-        (owner_id,),
+        WHERE ZADDRESS IS NOT NULL AND ZADDRESS != ''
+        """
     )
 
-    emails = []
-    for row in cursor:
-        if row["ZADDRESS"]:
-            emails.append(row["ZADDRESS"].lower())
+    emails: dict[int, list[str]] = defaultdict(list)
+    for owner_id, address in cursor:
+        emails[owner_id].append(address.lower())
 
     return emails
 
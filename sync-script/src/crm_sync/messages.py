@@ -2,7 +2,7 @@
 
 import sqlite3
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterator
 
@@ -10,8 +10,39 @@ from typing import Iterator
 # Difference from Unix epoch (1970-01-01) in seconds
 APPLE_EPOCH_OFFSET = 978307200
 
-
-@dataclass
+_UTC = timezone.utc
+_APPLE_EPOCH = datetime(2001, 1, 1, tzinfo=_UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Largest exclude set passed to SQLite as inline NOT IN (...) parameters;
+# larger sets are loaded into a temp table
+MAX_INLINE_EXCLUDES = 500
+
+# Rows fetched from SQLite per fetchmany() call
+FETCH_BATCH_SIZE = 10_000
+
+# Interaction type indexed by is_from_me
+_MESSAGE_TYPES = ("TEXT_INBOUND", "TEXT_OUTBOUND")
+
+# Base message query; read_messages fills in the optional INDEXED BY clause
+# and appends its filters.
+_MESSAGES_QUERY = """
+    SELECT
+        m.ROWID,
+        m.guid,
+        m.date,
+        m.is_from_me,
+        h.id as handle
+    FROM message m{indexed_by}
+    JOIN handle h ON m.handle_id = h.ROWID
+    WHERE h.id IS NOT NULL
+      AND h.id != ''
+      AND m.date IS NOT NULL
+      AND m.date != 0
+"""
+
+
+@dataclass(slots=True)
 class Message:
     """Message data from iMessage database."""
 
@@ -20,12 +51,15 @@ class Message:
     date: datetime
     is_from_me: bool
     handle: str  # Phone number or email
+    handle_kind: str  # "phone" or "email"
 
 
 def apple_timestamp_to_datetime(apple_ts: int | None) -> datetime | None:
     """Convert Apple Core Data timestamp to datetime.
 
-    Apple timestamps are nanoseconds since 2001-01-01 00:00:00 UTC.
+    Apple timestamps are nanoseconds since 2001-01-01 00:00:00 UTC. Uses
+    exact integer math; read_messages inlines a faster float conversion
+    instead of calling this.
 
     Args:
         apple_ts: Apple timestamp in nanoseconds
@@ -37,10 +71,9 @@ def apple_timestamp_to_datetime(apple_ts: int | None) -> datetime | None:
         return None
 
     try:
-        # Convert nanoseconds to seconds and add Apple epoch offset
-        unix_ts = (apple_ts / 1_000_000_000) + APPLE_EPOCH_OFFSET
-        return datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-    except (OSError, OverflowError, ValueError):
+        # Integer nanoseconds -> microseconds, exact (no float rounding)
+        return _APPLE_EPOCH + timedelta(microseconds=apple_ts // 1000)
+    except (OverflowError, TypeError, ValueError):
         return None
 
 
@@ -60,9 +93,8 @@ def datetime_to_apple_timestamp(dt: datetime | None) -> int:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
-    unix_ts = dt.timestamp()
-    apple_ts = (unix_ts - APPLE_EPOCH_OFFSET) * 1_000_000_000
-    return int(apple_ts)
+    # Exact integer microseconds since the Apple epoch, scaled to nanoseconds
+    return (dt - _APPLE_EPOCH) // _ONE_MICROSECOND * 1000
 
 
 def get_messages_database_path() -> Path:
@@ -85,71 +117,149 @@ def open_messages_database() -> sqlite3.Connection:
         f"file:{db_path}?immutable=1",
         uri=True,
     )
-    conn.row_factory = sqlite3.Row
+
+    # chat.db is often hundreds of MB: memory-map up to 1 GB of it, keep a
+    # ~128 MB page cache, and keep temp tables (large exclude sets) in memory.
+    # query_only is left off since it also blocks those temp tables.
+    conn.execute("PRAGMA mmap_size = 1073741824")
+    conn.execute("PRAGMA cache_size = -131072")
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
 
 def read_messages(
     since_timestamp: int | None = None,
     exclude_guids: set[str] | None = None,
+    synced_db: Path | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> Iterator[Message]:
     """Read messages from the iMessage database.
 
     Args:
         since_timestamp: Apple timestamp to filter messages after (optional)
         exclude_guids: Set of message GUIDs to skip (already synced)
+        synced_db: Sync state database whose synced_messages table lists
+            more GUIDs to skip (optional)
+        conn: Connection from open_messages_database to reuse across reads
+            (optional; otherwise one is opened and closed per call)
 
     Yields:
         Message for each message record
     """
     exclude_guids = exclude_guids or set()
 
-    conn = open_messages_database()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = open_messages_database()
+    cursor = None
+    attached = False
+    temp_table = False
 
     try:
-        # Build query with optional timestamp filter
-        query = """
-            SELECT
-                m.ROWID,
-                m.guid,
-                m.date,
-                m.is_from_me,
-                h.id as handle
-            FROM message m
-            JOIN handle h ON m.handle_id = h.ROWID
-            WHERE h.id IS NOT NULL
-        """
+        # Walk message.date's index (message_idx_date on current macOS) when
+        # there is one, so the date filter and ORDER BY need no sort
+        date_index = _find_date_index(conn)
+        indexed_by = f' INDEXED BY "{date_index}"' if date_index else ""
+
+        # Build filters with optional timestamp filter
+        query = ""
         params: list = []
 
         if since_timestamp:
             query += " AND m.date > ?"
             params.append(since_timestamp)
 
+        # Let SQLite skip previously synced messages with an anti-join
+        if synced_db:
+            conn.execute("ATTACH DATABASE ? AS synced", (f"file:{synced_db}?mode=ro",))
+            attached = True
+            query += " AND m.guid NOT IN (SELECT guid FROM synced.synced_messages)"
+
+        # Skip already synced messages in SQL: small sets inline, large sets
+        # via a temp table so we stay under SQLite's parameter limit
+        if len(exclude_guids) > MAX_INLINE_EXCLUDES:
+            conn.execute(
+                "CREATE TEMP TABLE excluded_messages (guid TEXT PRIMARY KEY) WITHOUT ROWID"
+            )
+            temp_table = True
+            conn.executemany(
+                "INSERT INTO excluded_messages VALUES (?)",
+                ((guid,) for guid in exclude_guids),
+            )
+            # End the implicit transaction the INSERT opened (it would block DETACH)
+            conn.commit()
+            query += " AND m.guid NOT IN (SELECT guid FROM excluded_messages)"
+        elif exclude_guids:
+            query += f" AND m.guid NOT IN ({', '.join('?' * len(exclude_guids))})"
+            params.extend(exclude_guids)
+
         query += " ORDER BY m.date"
 
-        cursor = conn.execute(query, params)
+        try:
+            cursor = conn.execute(_MESSAGES_QUERY.format(indexed_by=indexed_by) + query, params)
+        except sqlite3.OperationalError:
+            # SQLite rejects INDEXED BY it can't use; let the planner choose
+            if not indexed_by:
+                raise
+            cursor = conn.execute(_MESSAGES_QUERY.format(indexed_by="") + query, params)
+        cursor.arraysize = FETCH_BATCH_SIZE
+
+        # Bind hot-loop globals as locals
+        from_timestamp = datetime.fromtimestamp
+        utc = _UTC
+
+        # Handles repeat across thousands of messages; share one str each
+        handle_cache: dict[str, str] = {}
+
+        while rows := cursor.fetchmany():
+            for rowid, guid, apple_ts, is_from_me, handle in rows:
+                # Inlined apple_timestamp_to_datetime (NULL/0 dates filtered in SQL)
+                try:
+                    date = from_timestamp(apple_ts / 1_000_000_000 + APPLE_EPOCH_OFFSET, utc)
+                except (OSError, OverflowError, ValueError):
+                    continue
+
+                handle = handle_cache.setdefault(handle, handle)
+                yield Message(
+                    rowid=rowid,
+                    guid=guid,
+                    date=date,
+                    is_from_me=bool(is_from_me),
+                    handle=handle,
+                    handle_kind="email" if "@" in handle else "phone",
+                )
 
-        for row in cursor:
-            guid = row["guid"]
+    finally:
+        if owns_conn:
+            conn.close()
+        else:
+            # Leave a shared connection as we found it
+            if cursor is not None:
+                cursor.close()
+            if temp_table:
+                conn.execute("DROP TABLE temp.excluded_messages")
+            if attached:
+                conn.execute("DETACH DATABASE synced")
 
-            # Skip already synced messages
-            if guid in exclude_guids:
-                continue
 
-            date = apple_timestamp_to_datetime(row["date"])
-            if date is None:
-                continue
+def _find_date_index(conn: sqlite3.Connection) -> str | None:
+    """Find a full (non-partial) index on message whose leading column is date.
 
-            yield Message(
-                rowid=row["ROWID"],
-                guid=guid,
-                date=date,
-                is_from_me=bool(row["is_from_me"]),
-                handle=row["handle"],
-            )
+    Args:
+        conn: Database connection
 
-    finally:
-        conn.close()
+    Returns:
+        Index name, or None if there is no such index
+    """
+    for _, name, _, _, partial in conn.execute("PRAGMA index_list(message)"):
+        if partial:
+            # INDEXED BY a partial index fails unless the WHERE implies it
+            continue
+        info = conn.execute(f'PRAGMA index_info("{name}")').fetchone()
+        if info and info[2] == "date" and '"' not in name:
+            return name
+
+    return None
 
 
 def check_messages_access() -> bool:
@@ -183,4 +293,4 @@ def get_message_type(is_from_me: bool) -> str:
     Returns:
         Interaction type string
     """
-    return "TEXT_OUTBOUND" if is_from_me else "TEXT_INBOUND"
+    return _MESSAGE_TYPES[is_from_me]
@@ -1,7 +1,34 @@
-"""Phone number normalization using phonenumbers library."""
+"""Phone number normalization using phonenumbers library.
+
+Normalization results are memoized: a sync sees the same few hundred
+numbers across thousands of messages and calls.
+"""
+
+from functools import lru_cache
 
 import phonenumbers
-from phonenumbers import NumberParseException, PhoneNumberFormat
+from phonenumbers import NumberParseException, PhoneNumber, PhoneNumberFormat
+
+# Deletes every ASCII character except digits and "+"
+_ASCII_STRIP_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not (chr(i).isdigit() or chr(i) == "+"))
+)
+
+
+def _parse(number: str, region: str | None) -> PhoneNumber | None:
+    """Parse a phone number.
+
+    Args:
+        number: Phone number string with surrounding whitespace removed
+        region: Region code for numbers without country code
+
+    Returns:
+        Parsed number or None if unparseable
+    """
+    try:
+        return phonenumbers.parse(number, region)
+    except NumberParseException:
+        return None
 
 
 def normalize_phone(raw: str | None, default_region: str = "US") -> str | None:
@@ -22,20 +49,36 @@ def normalize_phone(raw: str | None, default_region: str = "US") -> str | None:
     if not cleaned:
         return None
 
-    try:
-        parsed = phonenumbers.parse(cleaned, default_region)
+    return _normalize_phone_cached(cleaned, default_region)
 
-        if not phonenumbers.is_valid_number(parsed):
-            # Try parsing as-is if validation fails (some numbers may be valid but unusual)
-            if not phonenumbers.is_possible_number(parsed):
-                return None
 
-        return phonenumbers.format_number(parsed, PhoneNumberFormat.E164)
+@lru_cache(maxsize=131072)
+def _normalize_phone_cached(cleaned: str, default_region: str) -> str | None:
+    """Normalize a stripped, non-empty phone number (memoized).
 
-    except NumberParseException:
+    This is normalize_phone's only cache; the parse beneath it is not memoized.
+
+    Args:
+        cleaned: Phone number with surrounding whitespace removed
+        default_region: Default region code for numbers without country code
+
+    Returns:
+        E.164 formatted number or None if invalid
+    """
+    parsed = _parse(cleaned, default_region)
+    if parsed is None:
         return None
 
+    # Accept possible (right length) or valid numbers; the length check is
+    # far cheaper than full validation, so try it first
+    if not phonenumbers.is_possible_number(parsed):
+        if not phonenumbers.is_valid_number(parsed):
+            return None
+
+    return phonenumbers.format_number(parsed, PhoneNumberFormat.E164)
 
+
+@lru_cache(maxsize=8192)
 def format_phone_display(e164: str | None) -> str:
     """Format E.164 number for display (e.g., +1-902-555-1234).
 
@@ -48,13 +91,14 @@ def format_phone_display(e164: str | None) -> str:
     if not e164:
         return ""
 
-    try:
-        parsed = phonenumbers.parse(e164, None)
-        return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
-    except NumberParseException:
+    parsed = _parse(e164, None)
+    if parsed is None:
         return e164
 
+    return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+
 
+@lru_cache(maxsize=8192)
 def strip_phone_formatting(raw: str | None) -> str | None:
     """Strip all formatting from a phone number, keeping only digits and +.
 
@@ -69,8 +113,15 @@ def strip_phone_formatting(raw: str | None) -> str | None:
     if not raw:
         return None
 
-    # Keep only digits and leading +
-    cleaned = "".join(c for c in raw if c.isdigit() or c == "+")
+    # Already bare (e.g. E.164 numbers stored in the CRM)
+    if raw.isdigit() or (raw[0] == "+" and raw[1:].isdigit()):
+        return raw
+
+    # Keep only digits and leading + (non-ASCII input may hold Unicode digits)
+    if raw.isascii():
+        cleaned = raw.translate(_ASCII_STRIP_TABLE)
+    else:
+        cleaned = "".join(c for c in raw if c.isdigit() or c == "+")
     if not cleaned or cleaned == "+":
         return None
 